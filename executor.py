@@ -4,74 +4,150 @@ executor.py
 Concurrent execution engine with failure isolation.
 """
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+import random
+from collections import deque
+from typing import List, Optional, cast
 
 from models import Device, TaskResult, TaskStatus
-from retry_engine import execute_with_retry
+from retry_engine import (
+    DEFAULT_MAX_DELAY,
+    compute_backoff_delays,
+    execute_with_retry,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def execute_tasks_concurrently(
+def _device_rng(device: Device, seed: Optional[int]) -> random.Random:
+    """
+    Create a private random generator for one device.
+
+    Each device gets its own generator rather than sharing the global one,
+    so with a seed its draws do not depend on task interleaving.
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{device.name}")
+
+
+async def _safe_execute(
+    device: Device,
+    max_attempts: int,
+    delays: List[float],
+    realtime: bool,
+    seed: Optional[int],
+) -> TaskResult:
+    """
+    Run execute_with_retry for one device, turning any unexpected
+    exception into a FAILED TaskResult for that device.
+    """
+    try:
+        result = await execute_with_retry(
+            device,
+            max_attempts=max_attempts,
+            delays=delays,
+            realtime=realtime,
+            rng=_device_rng(device, seed),
+        )
+    except Exception as e:
+        # Handle unexpected exceptions during execution
+        logger.error("Unexpected exception processing %s: %s", device.name, e)
+        return TaskResult(
+            device=device,
+            status=TaskStatus.FAILED,
+            error_message=f"Execution exception: {str(e)}",
+        )
+
+    logger.debug("Completed %s: %s", device.name, result.status.value)
+    return result
+
+
+async def execute_tasks_async(
     devices: List[Device],
     max_workers: int = 10,
     max_attempts: int = 3,
     initial_delay: float = 1.0,
     backoff_multiplier: float = 2.0,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    realtime: bool = False,
+    seed: Optional[int] = None,
 ) -> List[TaskResult]:
     """
     Execute tasks on multiple devices concurrently with failure isolation.
 
     Each device is processed independently - one failure does not affect
-    others. Uses ThreadPoolExecutor for concurrent execution.
+    others. Up to max_workers worker coroutines pull the next pending device
+    from a shared deque as soon as they finish their previous one, so a
+    worker stuck on slow devices does not hold back work another worker
+    could pick up.
 
     Args:
         devices: List of devices to process
-        max_workers: Maximum number of concurrent worker threads
+        max_workers: Maximum number of devices processed concurrently
         max_attempts: Maximum retry attempts per device
         initial_delay: Initial retry delay in seconds
         backoff_multiplier: Exponential backoff multiplier
+        max_delay: Maximum retry delay in seconds
+        realtime: Wait out the full timeout on simulated timeouts
+        seed: Seed for reproducible per-device failure outcomes
 
     Returns:
         List of TaskResult objects, one per device
     """
-    results = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_device = {
-            executor.submit(
-                execute_with_retry,
-                device,
+    num_workers = max(1, min(max_workers, len(devices)))
+    delays = compute_backoff_delays(
+        max_attempts, initial_delay, backoff_multiplier, max_delay
+    )
+    results: List[Optional[TaskResult]] = [None] * len(devices)
+
+    # Pending device indices; popleft never yields to the event loop, so
+    # workers can share the deque without a lock
+    pending = deque(range(len(devices)))
+
+    async def _worker() -> None:
+        while pending:
+            index = pending.popleft()
+            results[index] = await _safe_execute(
+                devices[index],
                 max_attempts,
-                initial_delay,
-                backoff_multiplier,
-            ): device
-            for device in devices
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_device):
-            device = future_to_device[future]
-            try:
-                result = future.result()
-                results.append(result)
-                logger.debug(
-                    f"Completed {device.name}: {result.status.value}"
-                )
-            except Exception as e:
-                # Handle unexpected exceptions during execution
-                logger.error(
-                    f"Unexpected exception processing {device.name}: {e}"
-                )
-                results.append(
-                    TaskResult(
-                        device=device,
-                        status=TaskStatus.FAILED,
-                        error_message=f"Execution exception: {str(e)}",
-                    )
-                )
-
-    return results
+                delays,
+                realtime,
+                seed,
+            )
+
+    await asyncio.gather(*(_worker() for _ in range(num_workers)))
+
+    # Every slot is filled once all workers have drained the deque
+    return cast(List[TaskResult], results)
+
+
+def execute_tasks_concurrently(
+    devices: List[Device],
+    max_workers: int = 10,
+    max_attempts: int = 3,
+    initial_delay: float = 1.0,
+    backoff_multiplier: float = 2.0,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    realtime: bool = False,
+    seed: Optional[int] = None,
+) -> List[TaskResult]:
+    """
+    Synchronous wrapper around execute_tasks_async.
+
+    Runs the concurrent execution on a fresh event loop and returns the
+    results once every device has finished.
+    """
+    return asyncio.run(
+        execute_tasks_async(
+            devices,
+            max_workers=max_workers,
+            max_attempts=max_attempts,
+            initial_delay=initial_delay,
+            backoff_multiplier=backoff_multiplier,
+            max_delay=max_delay,
+            realtime=realtime,
+            seed=seed,
+        )
+    )
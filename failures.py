@@ -4,31 +4,52 @@ failures.py
 Failure injection mechanisms for simulating different failure types.
 """
 
+import asyncio
 import random
-import time
 import logging
+from typing import Optional
 
 from models import Device, FailureType, TaskStatus, TaskResult
 
 logger = logging.getLogger(__name__)
 
+# Operation names and their per-operation outcome strings, built once
+_OPERATIONS = ("gather_facts", "backup_config", "check_version")
+_OP_SUCCESS = tuple(f"{op}: success" for op in _OPERATIONS)
+_OP_FAILED = tuple(f"{op}: failed" for op in _OPERATIONS)
 
-def simulate_task(device: Device) -> TaskResult:
+
+async def simulate_task(
+    device: Device,
+    realtime: bool = False,
+    rng: Optional[random.Random] = None,
+) -> TaskResult:
     """
     Simulate executing a task on a device with failure injection.
 
     This function simulates various failure scenarios based on the device's
     failure_type configuration. It performs operations like gathering device
     facts, backing up config, and checking version.
+
+    Timeouts are reported without waiting out the full timeout unless
+    realtime is set, in which case the task sleeps past timeout_seconds.
+    All random draws come from rng, so a per-device generator makes the
+    outcome independent of how concurrent tasks are interleaved. Without
+    rng, draws come from the random module's shared generator.
     """
-    operations = ["gather_facts", "backup_config", "check_version"]
-    partial_results = []
+    rnd = rng.random if rng is not None else random.random
+    getrandbits = rng.getrandbits if rng is not None else random.getrandbits
+    failure_type = device.failure_type
 
     try:
-        if device.failure_type == FailureType.TIMEOUT:
-            # Simulate timeout by sleeping longer than timeout_seconds
-            logger.debug(f"Simulating timeout for {device.name}")
-            time.sleep(device.timeout_seconds + 2)
+        if failure_type == FailureType.TIMEOUT:
+            # Simulate timeout - only sleep past timeout_seconds in realtime
+            # mode, otherwise take a short scaled delay
+            logger.debug("Simulating timeout for %s", device.name)
+            if realtime:
+                await asyncio.sleep(device.timeout_seconds + 2)
+            else:
+                await asyncio.sleep(min(0.05, device.timeout_seconds / 100))
             return TaskResult(
                 device=device,
                 status=TaskStatus.TIMEOUT,
@@ -36,10 +57,12 @@ def simulate_task(device: Device) -> TaskResult:
                 error_message=f"Operation timed out after {device.timeout_seconds}s",
             )
 
-        elif device.failure_type == FailureType.FLAKY:
-            # Flaky devices have a random chance of failure
-            if random.random() < device.failure_rate:
-                logger.debug(f"Simulating flaky failure for {device.name}")
+        elif failure_type == FailureType.FLAKY:
+            # Flaky devices have a random chance of failure. A single draw
+            # decides failure and, rescaled, the duration of a success.
+            r = rnd()
+            if r < device.failure_rate:
+                logger.debug("Simulating flaky failure for %s", device.name)
                 return TaskResult(
                     device=device,
                     status=TaskStatus.FAILED,
@@ -47,35 +70,35 @@ def simulate_task(device: Device) -> TaskResult:
                     error_message="Connection failed - flaky device",
                 )
             # Success case - simulate normal operation
-            time.sleep(0.1 + random.random() * 0.5)
+            r = (r - device.failure_rate) / (1.0 - device.failure_rate)
+            await asyncio.sleep(0.1 + r * 0.5)
             return TaskResult(
                 device=device,
                 status=TaskStatus.SUCCESS,
                 attempts=1,
-                partial_results=operations,
+                partial_results=list(_OPERATIONS),
             )
 
-        elif device.failure_type == FailureType.PARTIAL:
+        elif failure_type == FailureType.PARTIAL:
             # Partial failure: some operations succeed, others fail
-            logger.debug(f"Simulating partial failure for {device.name}")
-            for operation in operations:
-                if random.random() < 0.5:
-                    partial_results.append(f"{operation}: success")
-                else:
-                    partial_results.append(f"{operation}: failed")
-            time.sleep(0.2 + random.random() * 0.3)
+            logger.debug("Simulating partial failure for %s", device.name)
+            # One random bit per operation: set bit means that operation failed
+            bits = getrandbits(len(_OPERATIONS))
+            partial_results = [
+                _OP_FAILED[i] if (bits >> i) & 1 else _OP_SUCCESS[i]
+                for i in range(len(_OPERATIONS))
+            ]
+            await asyncio.sleep(0.2 + rnd() * 0.3)
 
             # If any operation failed, return partial status
-            failed_count = sum(
-                1 for r in partial_results if r.endswith(": failed")
-            )
+            failed_count = bin(bits).count("1")
             if failed_count > 0:
                 return TaskResult(
                     device=device,
                     status=TaskStatus.PARTIAL,
                     attempts=1,
                     partial_results=partial_results,
-                    error_message=f"{failed_count} of {len(operations)} operations failed",
+                    error_message=f"{failed_count} of {len(_OPERATIONS)} operations failed",
                 )
             return TaskResult(
                 device=device,
@@ -86,16 +109,18 @@ def simulate_task(device: Device) -> TaskResult:
 
         else:
             # No failure - normal successful operation
-            time.sleep(0.1 + random.random() * 0.4)
+            await asyncio.sleep(0.1 + rnd() * 0.4)
             return TaskResult(
                 device=device,
                 status=TaskStatus.SUCCESS,
                 attempts=1,
-                partial_results=operations,
+                partial_results=list(_OPERATIONS),
             )
 
     except Exception as e:
-        logger.error(f"Unexpected error simulating task for {device.name}: {e}")
+        logger.error(
+            "Unexpected error simulating task for %s: %s", device.name, e
+        )
         return TaskResult(
             device=device,
             status=TaskStatus.FAILED,
@@ -4,10 +4,15 @@ models.py
 Data models for devices and task results in the automation failure simulator.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List
 
+# Slotted dataclasses drop the per-instance __dict__, which dominates
+# memory for large device counts. slots=True requires Python 3.10+.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class FailureType(Enum):
     """Types of failures that can be simulated."""
@@ -27,7 +32,7 @@ class TaskStatus(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Device:
     """Represents a device with configurable failure profile."""
 
@@ -38,7 +43,7 @@ class Device:
     timeout_seconds: int = 5
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TaskResult:
     """Result of executing a task on a device."""
 
@@ -21,20 +21,61 @@ def generate_report(results: List[TaskResult], total_time: float) -> str:
         Formatted report string
     """
     total_devices = len(results)
-    successful = sum(1 for r in results if r.status == TaskStatus.SUCCESS)
-    failed = sum(1 for r in results if r.status == TaskStatus.FAILED)
-    timed_out = sum(1 for r in results if r.status == TaskStatus.TIMEOUT)
-    partial = sum(1 for r in results if r.status == TaskStatus.PARTIAL)
+
+    # Tally every status and format the per-device details in one pass
+    counts = {status: 0 for status in TaskStatus}
+    successful_attempts = 0
+    detail_lines: List[str] = []
+    append = detail_lines.append
+
+    for result in results:
+        status = result.status
+        device = result.device
+        counts[status] += 1
+
+        if status is TaskStatus.SUCCESS:
+            successful_attempts += result.attempts
+            if result.attempts == 1:
+                append(
+                    "  ✓ %s (%s) - Success on first try (%.2fs)"
+                    % (device.name, device.ip, result.elapsed_time)
+                )
+            else:
+                append(
+                    "  ✓ %s (%s) - Success after %d retries (%.2fs)"
+                    % (device.name, device.ip, result.attempts, result.elapsed_time)
+                )
+        elif status is TaskStatus.TIMEOUT:
+            append(
+                "  ✗ %s (%s) - Failed: Timeout after %d attempts (%.2fs)"
+                % (device.name, device.ip, result.attempts, result.elapsed_time)
+            )
+        elif status is TaskStatus.PARTIAL:
+            append(
+                "  ✗ %s (%s) - Partial failure: %s (%.2fs)"
+                % (device.name, device.ip, result.error_message, result.elapsed_time)
+            )
+        else:
+            append(
+                "  ✗ %s (%s) - Failed: %s after %d attempts (%.2fs)"
+                % (
+                    device.name,
+                    device.ip,
+                    result.error_message or "Unknown error",
+                    result.attempts,
+                    result.elapsed_time,
+                )
+            )
+
+    successful = counts[TaskStatus.SUCCESS]
+    failed = counts[TaskStatus.FAILED]
+    timed_out = counts[TaskStatus.TIMEOUT]
+    partial = counts[TaskStatus.PARTIAL]
 
     success_rate = (successful / total_devices * 100) if total_devices > 0 else 0
 
     # Calculate average retries for successful devices
-    successful_results = [r for r in results if r.status == TaskStatus.SUCCESS]
-    avg_retries = (
-        sum(r.attempts for r in successful_results) / len(successful_results)
-        if successful_results
-        else 0
-    )
+    avg_retries = successful_attempts / successful if successful else 0
 
     # Build report
     report_lines = [
@@ -53,37 +94,6 @@ def generate_report(results: List[TaskResult], total_time: float) -> str:
         report_lines.append(f"Average Retries (successful): {avg_retries:.1f}")
 
     report_lines.extend(["", "Device Details:"])
-
-    # Add per-device details
-    for result in results:
-        status_symbol = "✓" if result.status == TaskStatus.SUCCESS else "✗"
-        device_info = f"{status_symbol} {result.device.name} ({result.device.ip})"
-
-        if result.status == TaskStatus.SUCCESS:
-            if result.attempts == 1:
-                status_msg = f"Success on first try ({result.elapsed_time:.2f}s)"
-            else:
-                status_msg = (
-                    f"Success after {result.attempts} retries "
-                    f"({result.elapsed_time:.2f}s)"
-                )
-        elif result.status == TaskStatus.TIMEOUT:
-            status_msg = (
-                f"Failed: Timeout after {result.attempts} attempts "
-                f"({result.elapsed_time:.2f}s)"
-            )
-        elif result.status == TaskStatus.PARTIAL:
-            status_msg = (
-                f"Partial failure: {result.error_message} "
-                f"({result.elapsed_time:.2f}s)"
-            )
-        else:
-            error_msg = result.error_message or "Unknown error"
-            status_msg = (
-                f"Failed: {error_msg} after {result.attempts} attempts "
-                f"({result.elapsed_time:.2f}s)"
-            )
-
-        report_lines.append(f"  {device_info} - {status_msg}")
+    report_lines.extend(detail_lines)
 
     return "\n".join(report_lines)
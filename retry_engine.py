@@ -4,88 +4,139 @@ retry_engine.py
 Retry logic with exponential backoff for handling failures.
 """
 
-import time
+import asyncio
 import logging
+import random
+from time import monotonic
+from typing import List, Optional
 
 from models import Device, TaskResult, TaskStatus
 from failures import simulate_task
 
 logger = logging.getLogger(__name__)
 
+# Default cap on a single backoff delay, in seconds
+DEFAULT_MAX_DELAY = 60.0
 
-def execute_with_retry(
+# Statuses that are worth another attempt
+RETRYABLE_STATUSES = frozenset(
+    {TaskStatus.PARTIAL, TaskStatus.TIMEOUT, TaskStatus.FAILED}
+)
+
+
+def compute_backoff_delays(
+    max_attempts: int,
+    initial_delay: float = 1.0,
+    backoff_multiplier: float = 2.0,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> List[float]:
+    """
+    Compute the exponential backoff schedule for a retry run.
+
+    Args:
+        max_attempts: Maximum number of attempts
+        initial_delay: Initial delay before first retry in seconds
+        backoff_multiplier: Multiplier for exponential backoff
+        max_delay: Upper bound on any single delay in seconds
+
+    Returns:
+        Delay in seconds before each retry, one entry per retry
+    """
+    delays = []
+    delay = initial_delay
+    for _ in range(max_attempts - 1):
+        delays.append(min(delay, max_delay))
+        delay *= backoff_multiplier
+    return delays
+
+
+async def execute_with_retry(
     device: Device,
     max_attempts: int = 3,
     initial_delay: float = 1.0,
     backoff_multiplier: float = 2.0,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    delays: Optional[List[float]] = None,
+    realtime: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> TaskResult:
     """
     Execute a task on a device with retry logic and exponential backoff.
 
+    Each backoff delay is capped at max_delay and jittered to between 50%
+    and 100% of its value so that devices failing together do not all
+    retry at the same instant.
+
     Args:
         device: The device to execute the task on
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay before first retry in seconds
         backoff_multiplier: Multiplier for exponential backoff
+        max_delay: Upper bound on any single delay in seconds
+        delays: Precomputed backoff schedule from compute_backoff_delays;
+            derived from the three backoff arguments if omitted or if it
+            has fewer than max_attempts - 1 entries
+        realtime: Wait out the full timeout on simulated timeouts
+        rng: Random generator for failure injection and jitter; the
+            random module's shared generator is used if omitted
 
     Returns:
         TaskResult with the final status after all attempts
     """
-    start_time = time.time()
-
-    for attempt in range(1, max_attempts + 1):
-        logger.debug(
-            f"Attempt {attempt}/{max_attempts} for device {device.name}"
+    if delays is None or len(delays) < max_attempts - 1:
+        delays = compute_backoff_delays(
+            max_attempts, initial_delay, backoff_multiplier, max_delay
         )
 
-        result = simulate_task(device)
+    rnd = rng.random if rng is not None else random.random
 
-        # Success cases - return immediately
-        if result.status == TaskStatus.SUCCESS:
-            result.attempts = attempt
-            result.elapsed_time = time.time() - start_time
-            logger.info(
-                f"Success on attempt {attempt} for {device.name} "
-                f"after {result.elapsed_time:.2f}s"
-            )
-            return result
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    start_time = monotonic()
 
-        # For partial failures, we might want to retry or accept
-        # For this simulator, we'll retry partial failures
-        if result.status == TaskStatus.PARTIAL and attempt < max_attempts:
-            logger.debug(
-                f"Partial failure on attempt {attempt} for {device.name}, retrying..."
-            )
-        # Timeout failures can be retried
-        elif result.status == TaskStatus.TIMEOUT and attempt < max_attempts:
-            logger.debug(
-                f"Timeout on attempt {attempt} for {device.name}, retrying..."
-            )
-        # Regular failures can be retried if we have attempts left
-        elif result.status == TaskStatus.FAILED and attempt < max_attempts:
+    for attempt in range(1, max_attempts + 1):
+        if debug_enabled:
             logger.debug(
-                f"Failure on attempt {attempt} for {device.name}, retrying..."
+                "Attempt %d/%d for device %s", attempt, max_attempts, device.name
             )
-        else:
-            # Final attempt failed or no more attempts
-            result.attempts = attempt
-            result.elapsed_time = time.time() - start_time
-            logger.warning(
-                f"Failed after {attempt} attempts for {device.name} "
-                f"after {result.elapsed_time:.2f}s"
-            )
-            return result
 
-        # Calculate exponential backoff delay
-        if attempt < max_attempts:
-            delay = initial_delay * (backoff_multiplier ** (attempt - 1))
+        result = await simulate_task(device, realtime, rng)
+
+        # Stop on success, on the final attempt, or on a non-retryable status
+        if (
+            result.status is TaskStatus.SUCCESS
+            or attempt == max_attempts
+            or result.status not in RETRYABLE_STATUSES
+        ):
+            break
+
+        # Full-to-half jitter spreads out retries of simultaneous failures
+        delay = delays[attempt - 1] * (0.5 + rnd() * 0.5)
+        if debug_enabled:
             logger.debug(
-                f"Waiting {delay:.2f}s before retry {attempt + 1} "
-                f"for {device.name}"
+                "%s on attempt %d for %s, waiting %.2fs before retry %d",
+                result.status.value,
+                attempt,
+                device.name,
+                delay,
+                attempt + 1,
             )
-            time.sleep(delay)
+        await asyncio.sleep(delay)
+
+    result.attempts = attempt
+    result.elapsed_time = monotonic() - start_time
 
-    # Should not reach here, but handle edge case
-    result.attempts = max_attempts
-    result.elapsed_time = time.time() - start_time
+    if result.status is TaskStatus.SUCCESS:
+        logger.debug(
+            "Success on attempt %d for %s after %.2fs",
+            attempt,
+            device.name,
+            result.elapsed_time,
+        )
+    else:
+        logger.warning(
+            "Failed after %d attempts for %s after %.2fs",
+            attempt,
+            device.name,
+            result.elapsed_time,
+        )
     return result
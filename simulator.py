@@ -11,21 +11,52 @@ prevent one failure from breaking everything.
 
 import argparse
 import logging
+import queue
 import random
-import time
-from typing import List
+from logging.handlers import QueueHandler, QueueListener
+from time import monotonic
+from typing import List, Tuple
 
 from models import Device, FailureType
 from executor import execute_tasks_concurrently
 from reporter import generate_report
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging(
+    verbose: bool = False,
+) -> Tuple[QueueHandler, QueueListener]:
+    """
+    Route log records through a queue to a background listener thread.
+
+    Workers only enqueue records; writing to the console happens on the
+    listener thread, so logging never blocks the event loop on stream I/O.
+
+    Args:
+        verbose: Enable DEBUG level logging
+
+    Returns:
+        The QueueHandler installed on the root logger and the started
+        QueueListener; stop the listener to flush pending records and
+        remove the handler from the root logger when done
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    queue_handler = QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return queue_handler, listener
+
+
 def generate_devices(
     count: int,
     failure_rate: float,
@@ -51,42 +82,37 @@ def generate_devices(
         FailureType.PARTIAL,
     ]
 
-    for i in range(count):
-        ip = f"192.168.1.{i + 1}"
-        name = f"router{i + 1}"
+    # Pre-draw every failure type and flaky rate in bulk rather than
+    # dispatching to random.choice/random.random per device
+    random_types = random.choices(failure_types, k=failure_count)
+    flaky_rates = [0.6 + random.random() * 0.3 for _ in range(failure_count)]
 
+    # Build the name and IP tables with list comprehensions up front
+    numbers = range(1, count + 1)
+    names = [f"router{n}" for n in numbers]
+    ips = [f"192.168.1.{n}" for n in numbers]
+
+    for i, (name, ip) in enumerate(zip(names, ips)):
         if i < failure_count:
-            # Assign random failure type
-            failure_type = random.choice(failure_types)
-            if failure_type == FailureType.FLAKY:
-                # Flaky devices have 60-90% failure rate
-                failure_probability = 0.6 + random.random() * 0.3
-                device = Device(
-                    name=name,
-                    ip=ip,
-                    failure_type=failure_type,
-                    failure_rate=failure_probability,
-                    timeout_seconds=timeout_seconds,
-                )
-            else:
-                device = Device(
-                    name=name,
-                    ip=ip,
-                    failure_type=failure_type,
-                    failure_rate=0.0,
-                    timeout_seconds=timeout_seconds,
-                )
+            failure_type = random_types[i]
+            # Flaky devices have 60-90% failure rate
+            failure_probability = (
+                flaky_rates[i] if failure_type == FailureType.FLAKY else 0.0
+            )
         else:
             # No failure - healthy device
-            device = Device(
+            failure_type = FailureType.NONE
+            failure_probability = 0.0
+
+        devices.append(
+            Device(
                 name=name,
                 ip=ip,
-                failure_type=FailureType.NONE,
-                failure_rate=0.0,
+                failure_type=failure_type,
+                failure_rate=failure_probability,
                 timeout_seconds=timeout_seconds,
             )
-
-        devices.append(device)
+        )
 
     return devices
 
@@ -133,11 +159,30 @@ def main():
         default=2.0,
         help="Exponential backoff multiplier (default: 2.0)",
     )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=60.0,
+        help="Maximum delay between retries in seconds (default: 60.0)",
+    )
     parser.add_argument(
         "--max-workers",
         type=int,
         default=10,
-        help="Maximum concurrent worker threads (default: 10)",
+        help="Maximum devices processed concurrently (default: 10)",
+    )
+    parser.add_argument(
+        "--simulate-realtime",
+        action="store_true",
+        help="Wait out the full timeout on simulated timeouts instead of "
+        "reporting them immediately",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible device profiles and failure "
+        "outcomes (default: unseeded)",
     )
     parser.add_argument(
         "--verbose",
@@ -148,33 +193,43 @@ def main():
 
     args = parser.parse_args()
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-
-    logger.info("Starting Automation Failure Simulator")
-    logger.info(
-        f"Configuration: {args.devices} devices, "
-        f"{args.failure_rate}% failure rate, "
-        f"{args.max_retries} max retries"
-    )
-
-    # Generate devices with failure profiles
-    devices = generate_devices(
-        count=args.devices,
-        failure_rate=args.failure_rate,
-        timeout_seconds=args.timeout,
-    )
-
-    # Execute tasks concurrently
-    start_time = time.time()
-    results = execute_tasks_concurrently(
-        devices=devices,
-        max_workers=args.max_workers,
-        max_attempts=args.max_retries,
-        initial_delay=args.initial_delay,
-        backoff_multiplier=args.backoff,
-    )
-    total_time = time.time() - start_time
+    queue_handler, listener = configure_logging(args.verbose)
+    try:
+        logger.info("Starting Automation Failure Simulator")
+        logger.info(
+            "Configuration: %d devices, %s%% failure rate, %d max retries",
+            args.devices,
+            args.failure_rate,
+            args.max_retries,
+        )
+
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        # Generate devices with failure profiles
+        devices = generate_devices(
+            count=args.devices,
+            failure_rate=args.failure_rate,
+            timeout_seconds=args.timeout,
+        )
+
+        # Execute tasks concurrently
+        start_time = monotonic()
+        results = execute_tasks_concurrently(
+            devices=devices,
+            max_workers=args.max_workers,
+            max_attempts=args.max_retries,
+            initial_delay=args.initial_delay,
+            backoff_multiplier=args.backoff,
+            max_delay=args.max_delay,
+            realtime=args.simulate_realtime,
+            seed=args.seed,
+        )
+        total_time = monotonic() - start_time
+        logger.info("Completed %d devices in %.2fs", len(results), total_time)
+    finally:
+        listener.stop()
+        logging.getLogger().removeHandler(queue_handler)
 
     # Generate and print report
     report = generate_report(results, total_time)